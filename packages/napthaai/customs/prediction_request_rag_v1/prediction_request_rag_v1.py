@@ -147,18 +147,22 @@ class LLMClientManager:
         """Initializes and returns LLM and embedding clients."""
         if self.llm_provider:
             self._client = LLMClient(self.api_keys, self.llm_provider)
-        if self.embedding_provider:
+        if self.embedding_provider == self.llm_provider:
+            # same provider and key: reuse the SDK client and its connection pool
+            self._client_embedding = self._client
+        elif self.embedding_provider:
             self._client_embedding = LLMClient(self.api_keys, self.embedding_provider)
         return (self._client, self._client_embedding)
 
     def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
         """Closes the LLM and embedding clients."""
+        if self._client_embedding is not None:
+            if self._client_embedding is not self._client:
+                self._client_embedding.client.close()
+            self._client_embedding = None
         if self._client is not None:
             self._client.client.close()
             self._client = None
-        if self._client_embedding is not None:
-            self._client_embedding.client.close()
-            self._client_embedding = None
 
 
 # pylint: disable=too-few-public-methods
@@ -415,7 +419,8 @@ def clean_text(text: str) -> str:
     text = emoji_pattern.sub("", text)
     # Decode using UTF-8, replacing invalid bytes
     text = text.encode("utf-8", "replace").decode("utf-8", "replace")
-    text = "".join(ch for ch in text if ch.isprintable())
+    if not text.isprintable():
+        text = "".join(ch for ch in text if ch.isprintable())
     # Collapse whitespace
     text = re.sub(r"\s+", " ", text).strip()
     return text
@@ -652,9 +657,7 @@ def extract_text_from_pdf(
 
         with BytesIO(response.content) as pdf_file:
             reader = pypdf.PdfReader(pdf_file)
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text()
+            text = "".join(page.extract_text() for page in reader.pages)
 
         doc = ExtendedDocument(
             text=text[:num_words] if num_words else text, date="", url=url
@@ -766,10 +769,10 @@ def find_similar_chunks(
 
     index = faiss.IndexFlatIP(EMBEDDING_SIZE)  # pylint: disable=no-value-for-parameter
     index.add(  # pylint: disable=no-value-for-parameter
-        np.array([doc.embedding for doc in docs_with_embeddings])
+        np.array([doc.embedding for doc in docs_with_embeddings], dtype=np.float32)
     )
     _, indices = index.search(  # pylint: disable=no-value-for-parameter
-        np.array([query_embedding]), k
+        np.array([query_embedding], dtype=np.float32), k
     )
 
     return [docs_with_embeddings[i] for i in indices[0]]
@@ -36,6 +36,7 @@ from packages.napthaai.customs.prediction_request_rag_v1.prediction_request_rag_
     count_tokens,
     extract_texts,
     fetch_additional_information,
+    find_similar_chunks,
     multi_queries,
     run,
 )
@@ -45,10 +46,10 @@ class TestLLMClientManager:
     """Verify LLMClientManager creates per-context clients without globals."""
 
     def test_context_manager_returns_client_tuple(self) -> None:
-        """__enter__ returns a (client, client_embedding) tuple."""
+        """__enter__ returns a (client, client_embedding) tuple of separate clients."""
         mock_keys = {"openai": "sk-test"}
         mgr = LLMClientManager(
-            api_keys=mock_keys, model="gpt-4o-2024-08-06", embedding_provider="openai"
+            api_keys=mock_keys, model="claude-sonnet-4-6", embedding_provider="openai"
         )
         with patch(
             "packages.napthaai.customs.prediction_request_rag_v1.prediction_request_rag_v1.LLMClient"
@@ -61,6 +62,25 @@ class TestLLMClientManager:
                 assert llm_client is mock_llm
                 assert embedding_client is mock_embed
 
+    def test_same_provider_shares_one_client(self) -> None:
+        """Chat and embeddings on the same provider reuse a single client."""
+        mock_keys = {"openai": "sk-test"}
+        mgr = LLMClientManager(
+            api_keys=mock_keys, model="gpt-4o-2024-08-06", embedding_provider="openai"
+        )
+        with patch(
+            "packages.napthaai.customs.prediction_request_rag_v1.prediction_request_rag_v1.LLMClient"
+        ) as MockClient:
+            mock_llm = MagicMock(name="llm")
+            MockClient.return_value = mock_llm
+
+            with mgr as (llm_client, embedding_client):
+                assert llm_client is mock_llm
+                assert embedding_client is mock_llm
+
+            MockClient.assert_called_once()
+            mock_llm.client.close.assert_called_once()
+
     def test_no_global_client_variable(self) -> None:
         """The module must not define module-level client variables."""
         source = Path(module.__file__).read_text(encoding="utf-8")
@@ -645,3 +665,29 @@ class TestCountTokensAnthropic:
         result = count_tokens("hello world", "claude-sonnet-4-6", client=mock_client)
         assert isinstance(result, int)
         assert result > 0
+
+
+class TestFindSimilarChunks:
+    """Verify the faiss similarity search over chunk embeddings."""
+
+    def test_returns_nearest_chunks_first(self) -> None:
+        """Chunks are ranked by inner product with the query embedding."""
+        size = module.EMBEDDING_SIZE
+        docs = [
+            ExtendedDocument(text=f"t{i}", url=f"u{i}", embedding=[0.0] * size)
+            for i in range(3)
+        ]
+        for i, doc in enumerate(docs):
+            doc.embedding[i] = 1.0
+        query = [0.0] * size
+        query[2], query[0] = 0.9, 0.1
+        client_embedding = MagicMock()
+        client_embedding.embeddings.return_value.data = [
+            SimpleNamespace(embedding=query)
+        ]
+
+        similar = find_similar_chunks(
+            client_embedding, "q", docs, "text-embedding-3-large", k=2
+        )
+
+        assert [doc.url for doc in similar] == ["u2", "u0"]
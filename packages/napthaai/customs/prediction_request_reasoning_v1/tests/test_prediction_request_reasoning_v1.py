@@ -46,10 +46,10 @@ class TestLLMClientManager:
     """Verify LLMClientManager creates per-context clients without globals."""
 
     def test_context_manager_returns_client_tuple(self) -> None:
-        """__enter__ returns a (client, client_embedding) tuple."""
+        """__enter__ returns a (client, client_embedding) tuple of separate clients."""
         mock_keys = {"openai": "sk-test"}
         mgr = LLMClientManager(
-            api_keys=mock_keys, model="gpt-4.1-2025-04-14", embedding_provider="openai"
+            api_keys=mock_keys, model="claude-sonnet-4-6", embedding_provider="openai"
         )
         with patch(
             "packages.napthaai.customs.prediction_request_reasoning_v1.prediction_request_reasoning_v1.LLMClient"
@@ -62,6 +62,25 @@ class TestLLMClientManager:
                 assert llm_client is mock_llm
                 assert embedding_client is mock_embed
 
+    def test_same_provider_shares_one_client(self) -> None:
+        """Chat and embeddings on the same provider reuse a single client."""
+        mock_keys = {"openai": "sk-test"}
+        mgr = LLMClientManager(
+            api_keys=mock_keys, model="gpt-4.1-2025-04-14", embedding_provider="openai"
+        )
+        with patch(
+            "packages.napthaai.customs.prediction_request_reasoning_v1.prediction_request_reasoning_v1.LLMClient"
+        ) as MockClient:
+            mock_llm = MagicMock(name="llm")
+            MockClient.return_value = mock_llm
+
+            with mgr as (llm_client, embedding_client):
+                assert llm_client is mock_llm
+                assert embedding_client is mock_llm
+
+            MockClient.assert_called_once()
+            mock_llm.client.close.assert_called_once()
+
     def test_no_global_client_variable(self) -> None:
         """The module must not define module-level client variables."""
         source = Path(module.__file__).read_text(encoding="utf-8")
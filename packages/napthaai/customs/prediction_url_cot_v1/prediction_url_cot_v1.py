@@ -131,18 +131,22 @@ class LLMClientManager:
         """Initializes and returns LLM and embedding clients."""
         if self.llm_provider and self._client is None:
             self._client = LLMClient(self.api_keys, self.llm_provider)
-        if self.embedding_provider and self._client_embedding is None:
+        if self.embedding_provider == self.llm_provider:
+            # same provider and key: reuse the SDK client and its connection pool
+            self._client_embedding = self._client
+        elif self.embedding_provider and self._client_embedding is None:
             self._client_embedding = LLMClient(self.api_keys, self.embedding_provider)
         return (self._client, self._client_embedding)
 
     def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
         """Closes the LLM and embedding clients."""
+        if self._client_embedding is not None:
+            if self._client_embedding is not self._client:
+                self._client_embedding.client.close()
+            self._client_embedding = None
         if self._client is not None:
             self._client.client.close()
             self._client = None
-        if self._client_embedding is not None:
-            self._client_embedding.client.close()
-            self._client_embedding = None
 
 
 # pylint: disable=too-few-public-methods
@@ -286,6 +290,9 @@ EMOJI_PATTERN = re.compile(
 )
 WHITESPACE_COLLAPSE_PATTERN = re.compile(r"\s+")
 ALLOWED_WHITESPACE_CHARS = ("\n", "\t", "\r")
+ALLOWED_WHITESPACE_PATTERN = re.compile(
+    "[" + re.escape("".join(ALLOWED_WHITESPACE_CHARS)) + "]"
+)
 
 PREDICTION_PROMPT = """
 You will be evaluating the likelihood of an event based on a user's question and additional information from search results.
@@ -556,9 +563,7 @@ def extract_text_from_pdf(
 
         with BytesIO(response.content) as pdf_file:
             reader = pypdf.PdfReader(pdf_file)
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text()
+            text = "".join(page.extract_text() for page in reader.pages)
 
         doc = ExtendedDocument(
             text=text[:num_words] if num_words else text, date="", url=url
@@ -663,6 +668,17 @@ def extract_question(prompt: str) -> str:
 
 def count_words(text: str) -> int:
     """Count the number of words in a text."""
+    # Extracted pages are already joined on single spaces, in which case the
+    # separators can be counted without materialising the list of words.
+    # `isprintable` rules out any whitespace other than the ASCII space.
+    if (
+        text
+        and text.isprintable()
+        and "  " not in text
+        and text[0] != " "
+        and text[-1] != " "
+    ):
+        return text.count(" ") + 1
     return len(text.split())
 
 
@@ -743,10 +759,12 @@ def clean_text(text: str) -> str:
         text = text.replace(unicode_char, replacement)
     # Modified: Allow common whitespace characters (\n, \t, \r) to pass through
     # so they can be handled by the subsequent regex for whitespace collapsing.
-    # All other non-printable characters will still be removed.
-    text = "".join(
-        ch for ch in text if ch.isprintable() or ch in ALLOWED_WHITESPACE_CHARS
-    )
+    # All other non-printable characters will still be removed. Most pages
+    # have none, so check that in C first and skip the per-character filter.
+    if not ALLOWED_WHITESPACE_PATTERN.sub("", text).isprintable():
+        text = "".join(
+            ch for ch in text if ch.isprintable() or ch in ALLOWED_WHITESPACE_CHARS
+        )
 
     # This line will now correctly collapse newlines, tabs, and spaces into a single space.
     # Collapse all whitespace (including newlines, tabs, and spaces) into single spaces
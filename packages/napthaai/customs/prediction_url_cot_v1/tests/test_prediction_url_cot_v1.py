@@ -33,7 +33,9 @@ import packages.napthaai.customs.prediction_url_cot_v1.prediction_url_cot_v1 as
 from packages.napthaai.customs.prediction_url_cot_v1.prediction_url_cot_v1 import (
     ExtendedDocument,
     LLMClientManager,
+    clean_text,
     count_tokens,
+    count_words,
     extract_texts,
     fetch_additional_information,
     multi_queries,
@@ -45,10 +47,10 @@ class TestLLMClientManager:
     """Verify LLMClientManager creates per-context clients without globals."""
 
     def test_context_manager_returns_client_tuple(self) -> None:
-        """__enter__ returns a (client, client_embedding) tuple."""
+        """__enter__ returns a (client, client_embedding) tuple of separate clients."""
         mock_keys = {"openai": "sk-test"}
         mgr = LLMClientManager(
-            api_keys=mock_keys, model="gpt-4o-2024-08-06", embedding_provider="openai"
+            api_keys=mock_keys, model="claude-sonnet-4-6", embedding_provider="openai"
         )
         with patch(
             "packages.napthaai.customs.prediction_url_cot_v1.prediction_url_cot_v1.LLMClient"
@@ -61,6 +63,25 @@ class TestLLMClientManager:
                 assert llm_client is mock_llm
                 assert embedding_client is mock_embed
 
+    def test_same_provider_shares_one_client(self) -> None:
+        """Chat and embeddings on the same provider reuse a single client."""
+        mock_keys = {"openai": "sk-test"}
+        mgr = LLMClientManager(
+            api_keys=mock_keys, model="gpt-4o-2024-08-06", embedding_provider="openai"
+        )
+        with patch(
+            "packages.napthaai.customs.prediction_url_cot_v1.prediction_url_cot_v1.LLMClient"
+        ) as MockClient:
+            mock_llm = MagicMock(name="llm")
+            MockClient.return_value = mock_llm
+
+            with mgr as (llm_client, embedding_client):
+                assert llm_client is mock_llm
+                assert embedding_client is mock_llm
+
+            MockClient.assert_called_once()
+            mock_llm.client.close.assert_called_once()
+
     def test_no_global_client_variable(self) -> None:
         """The module must not define module-level client variables."""
         source = Path(module.__file__).read_text(encoding="utf-8")
@@ -599,3 +620,46 @@ class TestCountTokensAnthropic:
         result = count_tokens("hello world", "claude-sonnet-4-6", client=mock_client)
         assert isinstance(result, int)
         assert result > 0
+
+
+class TestCountWords:
+    """``count_words`` must agree with ``len(text.split())`` on every input."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "",
+            " ",
+            "single",
+            "two words",
+            "already normalised page text",
+            "  leading spaces",
+            "trailing spaces  ",
+            "double  space",
+            "line\nbreak",
+            "tab\tseparated",
+            "em\u2003space",
+            "non\u00a0breaking",
+        ],
+    )
+    def test_matches_split(self, text: str) -> None:
+        """The counting fast path and the split fallback return the same count."""
+        assert count_words(text) == len(text.split())
+
+
+class TestCleanText:
+    """``clean_text`` strips non-printable characters and collapses whitespace."""
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("plain text", "plain text"),
+            ("  line one\n\tline two\r\n", "line one line two"),
+            ("bell\x07 and null\x00 chars", "bell and null chars"),
+            ("zero\u200bwidth", "zerowidth"),
+            ("\u201cquoted\u201d \u2013 dash\u2026", '"quoted" - dash...'),
+        ],
+    )
+    def test_cleans_text(self, text: str, expected: str) -> None:
+        """Both the printable fast path and the per-character filter clean text."""
+        assert clean_text(text) == expected
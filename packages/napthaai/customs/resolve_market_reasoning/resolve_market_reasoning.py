@@ -84,7 +84,8 @@ def clean_text(text: str) -> str:
     text = emoji_pattern.sub("", text)
     # Decode using UTF-8, replacing invalid bytes
     text = text.encode("utf-8", "replace").decode("utf-8", "replace")
-    text = "".join(ch for ch in text if ch.isprintable())
+    if not text.isprintable():
+        text = "".join(ch for ch in text if ch.isprintable())
     # Collapse whitespace
     text = re.sub(r"\s+", " ", text).strip()
     return text
@@ -639,9 +640,7 @@ def extract_text_from_pdf(
 
         with BytesIO(response.content) as pdf_file:
             reader = pypdf.PdfReader(pdf_file)
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text()
+            text = "".join(page.extract_text() for page in reader.pages)
 
         doc = Document(text=text[:num_words] if num_words else text, date="", url=url)
 
@@ -713,12 +712,13 @@ def extract_texts(
 def process_in_batches(
     urls: List[str], window: int = 5, timeout: int = 50
 ) -> Generator[List[Tuple[Future, str]], None, None]:
-    """Iter URLs in batches."""
-    with ThreadPoolExecutor() as executor:
+    """Iter URLs in batches, reusing pooled connections across the batches."""
+    session: requests.Session
+    with ThreadPoolExecutor() as executor, requests.Session() as session:
         for i in range(0, len(urls), window):
             batch = urls[i : i + window]
             futures = [
-                (executor.submit(requests.get, url, timeout=timeout), url)
+                (executor.submit(session.get, url, timeout=timeout), url)
                 for url in batch
             ]
             yield futures
@@ -812,10 +812,10 @@ def find_similar_chunks(
 
     index = faiss.IndexFlatIP(EMBEDDING_SIZE)  # pylint: disable=no-value-for-parameter
     index.add(  # pylint: disable=no-value-for-parameter
-        np.array([doc.embedding for doc in docs_with_embeddings])
+        np.array([doc.embedding for doc in docs_with_embeddings], dtype=np.float32)
     )
     _, indices = index.search(  # pylint: disable=no-value-for-parameter
-        np.array([query_embedding]), k
+        np.array([query_embedding], dtype=np.float32), k
     )
 
     return [docs_with_embeddings[i] for i in indices[0]]
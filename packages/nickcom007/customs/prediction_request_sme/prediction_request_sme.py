@@ -364,14 +364,15 @@ def extract_text(
 def process_in_batches(
     urls: List[str], window: int = 5, timeout: int = 10
 ) -> Generator[List[Tuple[Future, str]], None, None]:
-    """Iter URLs in batches."""
-    with ThreadPoolExecutor() as executor:
+    """Iter URLs in batches, reusing pooled connections across the batches."""
+    session: requests.Session
+    with ThreadPoolExecutor() as executor, requests.Session() as session:
         for i in range(0, len(urls), window):
             batch = urls[i : i + window]
             futures = [
                 (
                     executor.submit(
-                        requests.get,
+                        session.get,
                         url,
                         timeout=timeout,
                         headers={"User-Agent": USER_AGENT_HEADER},
@@ -153,6 +153,9 @@ EMOJI_PATTERN = re.compile(
 )
 WHITESPACE_COLLAPSE_PATTERN = re.compile(r"\s+")
 ALLOWED_WHITESPACE_CHARS = ("\n", "\t", "\r")
+ALLOWED_WHITESPACE_PATTERN = re.compile(
+    "[" + re.escape("".join(ALLOWED_WHITESPACE_CHARS)) + "]"
+)
 N_MODEL_CALLS = 2
 
 USER_AGENT_HEADER = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0.0.0 Safari/537.36"
@@ -371,10 +374,12 @@ def clean_text(text: str) -> str:
         text = text.replace(unicode_char, replacement)
     # Modified: Allow common whitespace characters (\n, \t, \r) to pass through
     # so they can be handled by the subsequent regex for whitespace collapsing.
-    # All other non-printable characters will still be removed.
-    text = "".join(
-        ch for ch in text if ch.isprintable() or ch in ALLOWED_WHITESPACE_CHARS
-    )
+    # All other non-printable characters will still be removed. Most pages
+    # have none, so check that in C first and skip the per-character filter.
+    if not ALLOWED_WHITESPACE_PATTERN.sub("", text).isprintable():
+        text = "".join(
+            ch for ch in text if ch.isprintable() or ch in ALLOWED_WHITESPACE_CHARS
+        )
 
     # This line will now correctly collapse newlines, tabs, and spaces into a single space.
     # Collapse all whitespace (including newlines, tabs, and spaces) into single spaces
@@ -710,9 +715,7 @@ def extract_text_from_pdf(
 
         with BytesIO(response.content) as pdf_file:
             reader = pypdf.PdfReader(pdf_file)
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text()
+            text = "".join(page.extract_text() for page in reader.pages)
 
         doc = ExtendedDocument(
             text=text[:num_words] if num_words else text, date="", url=url
@@ -728,14 +731,15 @@ def extract_text_from_pdf(
 def process_in_batches(
     urls: List[str], window: int = 5, timeout: int = 10
 ) -> Generator[List[Tuple[Future, str]], None, None]:
-    """Iter URLs in batches."""
-    with ThreadPoolExecutor() as executor:
+    """Iter URLs in batches, reusing pooled connections across the batches."""
+    session: requests.Session
+    with ThreadPoolExecutor() as executor, requests.Session() as session:
         for i in range(0, len(urls), window):
             batch = urls[i : i + window]
             futures = [
                 (
                     executor.submit(
-                        requests.get,
+                        session.get,
                         url,
                         timeout=timeout,
                         headers={"User-Agent": USER_AGENT_HEADER},
@@ -37,6 +37,7 @@ from packages.valory.customs.prediction_request_v1.prediction_request_v1 import
     fetch_additional_information,
     fetch_multi_queries_with_retry,
     generate_prediction_with_retry,
+    process_in_batches,
     run,
 )
 
@@ -187,6 +188,25 @@ def _make_failed_future(url: str, status: int = 404) -> tuple:
     return (future, url)
 
 
+class TestProcessInBatches:
+    """Verify process_in_batches reuses one HTTP session for all batches."""
+
+    @patch(f"{MODULE}.requests.Session")
+    def test_single_session_across_batches(self, mock_session_cls: MagicMock) -> None:
+        """All URLs are fetched through the same pooled session."""
+        session = mock_session_cls.return_value.__enter__.return_value
+        urls = [f"http://example.com/{i}" for i in range(7)]
+
+        batches = list(process_in_batches(urls=urls, window=5))
+
+        assert [len(batch) for batch in batches] == [5, 2]
+        for batch in batches:
+            for future, _ in batch:
+                future.result()
+        mock_session_cls.assert_called_once_with()
+        assert session.get.call_count == len(urls)
+
+
 class TestExtractTextsCapture:
     """Verify extract_texts captures source content correctly."""
 
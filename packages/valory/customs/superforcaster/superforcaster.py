@@ -20,6 +20,7 @@
 
 import functools
 import json
+import random
 import re
 import time
 from datetime import date
@@ -29,7 +30,7 @@ import openai
 import requests
 from openai import OpenAI
 from pydantic import BaseModel, Field, model_validator
-from tiktoken import encoding_for_model
+from tiktoken import encoding_for_model, get_encoding
 
 MechResponseWithKeys = Tuple[
     str, Optional[str], Optional[Dict[str, Any]], Any, Optional[Dict[str, Any]], Any
@@ -155,25 +156,25 @@ def with_key_rotation(func: Callable) -> Callable:
         retries_left: Dict[str, int] = api_keys.max_retries()
 
         def execute() -> Union[MaxCostResponse, MechResponseWithKeys]:
-            """Retry the function with a new key."""
-            try:
-                result = func(*args, **kwargs)
-                # Max-cost path returns a float; pass through without appending
-                # api_keys (tuple concatenation would fail).
-                if isinstance(result, float):
-                    return result
-                return result + (api_keys,)
-            except openai.RateLimitError as e:
-                # try with a new key again
-                if retries_left["openai"] <= 0 and retries_left["openrouter"] <= 0:
-                    raise e
-                retries_left["openai"] -= 1
-                retries_left["openrouter"] -= 1
-                api_keys.rotate("openai")
-                api_keys.rotate("openrouter")
-                return execute()
-            except Exception as e:
-                return str(e), "", None, None, None, api_keys
+            """Retry the function with a new key until it succeeds or keys run out."""
+            while True:
+                try:
+                    result = func(*args, **kwargs)
+                    # Max-cost path returns a float; pass through without appending
+                    # api_keys (tuple concatenation would fail).
+                    if isinstance(result, float):
+                        return result
+                    return result + (api_keys,)
+                except openai.RateLimitError as e:
+                    # try with a new key again
+                    if retries_left["openai"] <= 0 and retries_left["openrouter"] <= 0:
+                        raise e
+                    retries_left["openai"] -= 1
+                    retries_left["openrouter"] -= 1
+                    api_keys.rotate("openai")
+                    api_keys.rotate("openrouter")
+                except Exception as e:
+                    return str(e), "", None, None, None, api_keys
 
         mech_response = execute()
         return mech_response
@@ -206,10 +207,10 @@ def count_tokens(text: str, model: str) -> int:
     try:
         enc = encoding_for_model(model)
     except KeyError:
-        from tiktoken import get_encoding
-
         enc = get_encoding("o200k_base")
-    return len(enc.encode(text))
+    # encode_ordinary skips the special-token scan encode runs over the whole
+    # text first; special-token strings are simply counted as text
+    return len(enc.encode_ordinary(text))
 
 
 DEFAULT_OPENAI_SETTINGS = {
@@ -223,6 +224,8 @@ ALLOWED_MODELS = [DEFAULT_OPENAI_MODEL]
 MAX_SOURCES = 5
 COMPLETION_RETRIES = 3
 COMPLETION_DELAY = 2
+# Match from 'question "' to '" and the `yes`' to handle nested quotes
+QUESTION_PATTERN = re.compile(r'question\s+"(.+?)"\s+and\s+the\s+`yes`', re.DOTALL)
 
 
 SYSTEM_PROMPT = "You are a helpful assistant."
@@ -336,7 +339,8 @@ def _parse_completion(
     :param temperature: sampling temperature (0 = deterministic).
     :param max_tokens: maximum tokens to generate.
     :param retries: number of retry attempts on transient / validation failure.
-    :param delay: delay in seconds between retries.
+    :param delay: base delay in seconds between retries, doubled on each retry,
+        plus up to ``delay`` seconds of random jitter.
     :param counter_callback: optional callback tracking token usage.
     :return: tuple of (parsed model instance, counter_callback).
     :raises RuntimeError: if all retries exhausted without a successful parse.
@@ -382,8 +386,13 @@ def _parse_completion(
             #   - ValueError — covers pydantic ValidationError (e.g. p_yes+p_no
             #     sum check) and the inline "Model refused…" raise above
             print(f"[superforcaster] Attempt {attempt + 1} failed: {e}")
-            time.sleep(delay)
             attempt += 1
+            if attempt < retries:
+                # exponential backoff with jitter, so retries after a 429 do not
+                # hit the API again in lockstep
+                time.sleep(
+                    delay * 2 ** (attempt - 1) + random.uniform(0, delay)
+                )  # nosec: B311
 
     raise RuntimeError("Failed to get structured LLM completion after retries")
 
@@ -397,7 +406,7 @@ def fetch_additional_sources(question: Any, serper_api_key: Any) -> requests.Res
         "Content-Type": "application/json",
     }
 
-    response = requests.request("POST", url, headers=headers, data=payload)
+    response = requests.request("POST", url, headers=headers, data=payload, timeout=30)
 
     return response
 
@@ -437,14 +446,11 @@ def format_sources_data(organic_data: Any, misc_data: Any) -> str:
 
 def extract_question(prompt: str) -> str:
     """Uses regexp to extract question from the prompt"""
-    # Match from 'question "' to '" and the `yes`' to handle nested quotes
-    pattern = r'question\s+"(.+?)"\s+and\s+the\s+`yes`'
-    try:
-        question = re.findall(pattern, prompt, re.DOTALL)[0]
-    except Exception as e:
-        print(f"Error extracting question: {e}")
-        question = prompt
-    return question
+    match = QUESTION_PATTERN.search(prompt)
+    if match is None:
+        print("Error extracting question: no question found in the prompt")
+        return prompt
+    return match.group(1)
 
 
 @with_key_rotation
@@ -24,6 +24,7 @@ import json
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import openai
 import pytest
 
 import packages.valory.customs.superforcaster.superforcaster as module
@@ -31,7 +32,10 @@ from packages.valory.customs.superforcaster.superforcaster import (
     OpenAIClientManager,
     PredictionResult,
     _parse_completion,
+    count_tokens,
+    extract_question,
     run,
+    with_key_rotation,
 )
 
 
@@ -312,3 +316,121 @@ class TestSuperforcasterSourceContent:
 
         used_params = result[4]
         assert "source_content" not in used_params
+
+
+class TestCountTokens:
+    """Verify token counting in superforcaster."""
+
+    def test_unknown_model_falls_back_to_o200k(self) -> None:
+        """Models unknown to tiktoken use the o200k_base encoding."""
+        enc = MagicMock()
+        enc.encode_ordinary.return_value = [1]
+        unknown = KeyError("unknown")
+        with patch(f"{SF_MODULE}.encoding_for_model", side_effect=unknown):
+            with patch(f"{SF_MODULE}.get_encoding", return_value=enc) as mock_get:
+                assert count_tokens("x", "some-new-model") == 1
+        mock_get.assert_called_once_with("o200k_base")
+
+    def test_counts_without_special_token_check(self) -> None:
+        """Counting uses encode_ordinary, never the special-token checking encode."""
+        enc = MagicMock()
+        enc.encode_ordinary.return_value = [1, 2]
+        with patch(f"{SF_MODULE}.encoding_for_model", return_value=enc):
+            assert count_tokens("<|endoftext|>", "gpt-4.1-2025-04-14") == 2
+        enc.encode_ordinary.assert_called_once_with("<|endoftext|>")
+        enc.encode.assert_not_called()
+
+
+class TestExtractQuestion:
+    """Verify the question is pulled out of the mech prompt."""
+
+    def test_extracts_question(self) -> None:
+        """The quoted question before the `yes` option is returned."""
+        assert extract_question(PREDICTION_PROMPT) == "Will X happen?"
+
+    def test_keeps_nested_quotes(self) -> None:
+        """Quotes inside the question do not cut it short."""
+        prompt = PREDICTION_PROMPT.replace("Will X happen?", 'Will "X" happen?')
+        assert extract_question(prompt) == 'Will "X" happen?'
+
+    def test_falls_back_to_prompt(self) -> None:
+        """Prompts without the expected structure are used verbatim."""
+        assert extract_question("Will it rain?") == "Will it rain?"
+
+
+class TestParseCompletionRetries:
+    """Verify _parse_completion backs off between retries."""
+
+    @patch(f"{SF_MODULE}.random.uniform", return_value=0.5)
+    @patch(f"{SF_MODULE}.time.sleep")
+    def test_exponential_backoff_without_trailing_sleep(
+        self, mock_sleep: MagicMock, _mock_uniform: MagicMock
+    ) -> None:
+        """Delays double between attempts and there is no sleep after the last one."""
+        client = MagicMock()
+        client.beta.chat.completions.parse.side_effect = ValueError("bad output")
+
+        with pytest.raises(RuntimeError):
+            _parse_completion(
+                client=client,
+                model="gpt-4.1-2025-04-14",
+                messages=[],
+                response_format=PredictionResult,
+                retries=3,
+                delay=2,
+            )
+
+        assert client.beta.chat.completions.parse.call_count == 3
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [2.5, 4.5]
+
+
+def _rate_limit_error() -> openai.RateLimitError:
+    """Build a RateLimitError with a stub response (no network, no httpx dep)."""
+    return openai.RateLimitError(
+        "rate limited", response=MagicMock(status_code=429), body=None
+    )
+
+
+class TestWithKeyRotation:
+    """Verify rate-limited calls are retried with rotated keys."""
+
+    @staticmethod
+    def _api_keys(retries: int) -> MagicMock:
+        """A KeyChain-like mock allowing ``retries`` rotations per service."""
+        api_keys = MagicMock()
+        api_keys.max_retries.return_value = {"openai": retries, "openrouter": retries}
+        return api_keys
+
+    def test_retries_until_success(self) -> None:
+        """Each rate limit rotates the keys and calls the function again."""
+        func = MagicMock(
+            side_effect=[_rate_limit_error(), _rate_limit_error(), ("ok", None)]
+        )
+        api_keys = self._api_keys(retries=5)
+
+        result = with_key_rotation(func)(api_keys=api_keys)
+
+        assert result == ("ok", None, api_keys)
+        assert func.call_count == 3
+        assert api_keys.rotate.call_count == 4
+
+    def test_reraises_when_keys_are_exhausted(self) -> None:
+        """Once no retries are left the rate-limit error propagates."""
+        func = MagicMock(side_effect=_rate_limit_error())
+        api_keys = self._api_keys(retries=2)
+
+        with pytest.raises(openai.RateLimitError):
+            with_key_rotation(func)(api_keys=api_keys)
+
+        assert func.call_count == 3
+
+
+class TestSerperRequest:
+    """Verify the Serper call cannot hang the task."""
+
+    def test_fetch_additional_sources_passes_timeout(self) -> None:
+        """The Serper request forwards timeout=30 (fleet standard)."""
+        with patch.object(module.requests, "request") as mock_request:
+            module.fetch_additional_sources("question?", "serper-key")
+        _, kwargs = mock_request.call_args
+        assert kwargs["timeout"] == 30
@@ -208,3 +208,14 @@ class TestSuperforcasterSourceContent:
         assert result[0] == PREDICTION_JSON
         used_params = result[4]
         assert "source_content" not in used_params
+
+
+class TestSerperRequest:
+    """Verify the Serper call cannot hang the task."""
+
+    def test_fetch_additional_sources_passes_timeout(self) -> None:
+        """The Serper request forwards timeout=30 (fleet standard)."""
+        with patch.object(module.requests, "request") as mock_request:
+            module.fetch_additional_sources("question?", "serper-key")
+        _, kwargs = mock_request.call_args
+        assert kwargs["timeout"] == 30
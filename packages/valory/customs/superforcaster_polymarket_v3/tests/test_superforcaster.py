@@ -711,3 +711,14 @@ class TestV3RunEndToEnd:
         )
         assert "ALLOWED_MODELS" in result[0]
         assert "claude-typo-3" in result[0]
+
+
+class TestSerperRequest:
+    """Verify the Serper call cannot hang the task."""
+
+    def test_fetch_additional_sources_passes_timeout(self) -> None:
+        """The Serper request forwards timeout=30 (fleet standard)."""
+        with patch.object(v3_module.requests, "request") as mock_request:
+            v3_module.fetch_additional_sources("question?", "serper-key")
+        _, kwargs = mock_request.call_args
+        assert kwargs["timeout"] == 30